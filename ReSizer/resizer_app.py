@@ -5,22 +5,34 @@ Optimizes large image folders by resizing and converting to WebP format (lossy,
 
 import sys
 import os
+import io
+import struct
+import shutil
+import tempfile
+import multiprocessing
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
 import traceback
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QProgressBar, QTextEdit,
+    QLabel, QLineEdit, QPushButton, QProgressBar, QPlainTextEdit,
     QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, QElapsedTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 
+import PIL
 from PIL import Image
+from PIL import UnidentifiedImageError
 from PIL import ExifTags
 
+# Pillow-SIMD is a drop-in replacement for Pillow; its releases carry a ".postN" suffix
+PILLOW_SIMD = '.post' in PIL.__version__
+
 # Try to import pillow-heif for HEIC support
 try:
     from pillow_heif import register_heif_opener
@@ -29,31 +41,168 @@ try:
 except ImportError:
     HEIC_SUPPORT = False
 
+# NumPy is needed by (and installed with) the optional accelerators below
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Try to import PyTurboJPEG for faster JPEG decoding
+try:
+    from turbojpeg import TurboJPEG, TJFLAG_FASTUPSAMPLE, TJFLAG_FASTDCT, TJPF_RGBX
+    _TJ = TurboJPEG()
+    TURBOJPEG_SUPPORT = True
+except (ImportError, OSError, RuntimeError):
+    # Module missing or libturbojpeg shared library not found
+    _TJ = None
+    TURBOJPEG_SUPPORT = False
+
+# Try to import OpenCV for faster (SIMD) area-averaging downscales
+try:
+    import cv2
+    OPENCV_SUPPORT = True
+except ImportError:
+    OPENCV_SUPPORT = False
+
+# Per-process buffer that JPEG pixels are decoded into, reused across images so large
+# decodes don't go through malloc/free every time. It never grows past
+# MAX_DIMENSION² RGBX pixels (~59 MB); larger decodes get a one-off allocation so an
+# idle worker doesn't keep the biggest image it has ever seen in memory.
+_DECODE_SCRATCH = None
+
 
 class ImageProcessor:
     """Handles image resizing and WebP conversion."""
 
-    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
+    # .webp inputs are only re-encoded (in place) when they exceed MAX_DIMENSION
+    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp'}
     if HEIC_SUPPORT:
         SUPPORTED_FORMATS.add('.heic')
 
+    # Extensions without the leading dot, for matching raw directory entry names
+    SUPPORTED_EXTENSIONS = frozenset(ext[1:] for ext in SUPPORTED_FORMATS)
+
     MAX_DIMENSION = 3840
 
+    # Bytes read up front to find the image dimensions without decoding
+    PROBE_BYTES = 64 * 1024
+
+    # JPEG start-of-frame markers (SOF0-SOF15 except DHT, JPG and DAC)
+    _JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+    @staticmethod
+    def read_image(file_path: Path) -> Tuple[Optional[bytes], int]:
+        """
+        Read an image file for conversion (I/O stage).
+        The header is probed first: if the image is already small enough the rest of
+        the file is never read and (None, max_dim) is returned. Otherwise returns
+        (file contents, 0).
+        Source files are read once, so on Linux the kernel is told to read ahead and
+        then drop their pages, instead of evicting more useful cache.
+        """
+        with open(file_path, 'rb') as f:
+            fd = f.fileno()
+            try:
+                dims = ImageProcessor._probe_dims(f.read(ImageProcessor.PROBE_BYTES))
+                if dims is not None and max(dims) <= ImageProcessor.MAX_DIMENSION:
+                    return None, max(dims)
+                ImageProcessor._fadvise(fd, 'POSIX_FADV_SEQUENTIAL')
+                f.seek(0)
+                return f.read(), 0
+            finally:
+                ImageProcessor._fadvise(fd, 'POSIX_FADV_DONTNEED')
+
+    @staticmethod
+    def _fadvise(fd: int, advice: str) -> None:
+        """Apply a posix_fadvise hint to a whole file (no-op where unsupported)."""
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+            except OSError:
+                pass
+
     @staticmethod
-    def process_image(file_path: Path) -> Tuple[bool, str]:
+    def skipped_message(file_path: Path, max_dim: int) -> str:
+        """Log message for an image that is already within MAX_DIMENSION."""
+        return f"Skipped (already {max_dim}px): {file_path.name}"
+
+    @staticmethod
+    def _probe_dims(head: bytes) -> Optional[Tuple[int, int]]:
         """
-        Process a single image file.
-        Returns: (success: bool, message: str)
+        Parse (width, height) from the first bytes of a JPEG, PNG, WebP or BMP file.
+        Returns None for other formats or when the header isn't in `head`; callers
+        then fall back to Pillow.
         """
         try:
-            with Image.open(file_path) as img:
+            if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+                return struct.unpack('>II', head[16:24])
+
+            if head.startswith(b'\xff\xd8'):
+                # Walk marker segments until a start-of-frame header
+                i = 2
+                while i + 9 <= len(head):
+                    if head[i] != 0xFF:
+                        return None
+                    marker = head[i + 1]
+                    if marker == 0xFF:  # fill byte
+                        i += 1
+                    elif marker in ImageProcessor._JPEG_SOF_MARKERS:
+                        height, width = struct.unpack('>HH', head[i + 5:i + 9])
+                        return width, height
+                    elif 0xD0 <= marker <= 0xD7 or marker == 0x01:  # standalone markers
+                        i += 2
+                    else:
+                        i += 2 + struct.unpack('>H', head[i + 2:i + 4])[0]
+                return None
+
+            if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+                chunk = head[12:16]
+                if chunk == b'VP8 ' and head[23:26] == b'\x9d\x01\x2a':
+                    width, height = struct.unpack('<HH', head[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk == b'VP8L' and head[20] == 0x2F:
+                    bits = struct.unpack('<I', head[21:25])[0]
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b'VP8X':
+                    width = int.from_bytes(head[24:27], 'little') + 1
+                    height = int.from_bytes(head[27:30], 'little') + 1
+                    return width, height
+                return None
+
+            if head[:2] == b'BM':
+                width, height = struct.unpack('<ii', head[18:26])
+                return width, abs(height)
+
+        except (struct.error, IndexError):
+            pass
+        return None
+
+    @staticmethod
+    def convert_image(file_path: Path, data: bytes) -> Tuple[bool, str, Optional[bytes]]:
+        """
+        Decode, resize and encode an image already read into memory (CPU stage).
+        Returns: (success: bool, message: str, webp_data: bytes or None if nothing to write)
+        """
+        try:
+            img = Image.open(io.BytesIO(data))
+            source = None
+            pixels = None
+            try:
                 # Get original dimensions
                 width, height = img.size
                 max_dim = max(width, height)
 
-                # Check if resizing is needed
+                # Check if resizing is needed (header only; no pixels decoded yet)
                 if max_dim <= ImageProcessor.MAX_DIMENSION:
-                    return False, f"Skipped (already {max_dim}px): {file_path.name}"
+                    return False, ImageProcessor.skipped_message(file_path, max_dim), None
+
+                # Resizing keeps only the first frame; leave multi-frame files untouched.
+                # MPO JPEGs (Ultra HDR gain maps, embedded previews) also report
+                # is_animated but are resized from their primary image.
+                if img.format in ('WEBP', 'PNG') and getattr(img, 'is_animated', False):
+                    return False, f"Skipped (animated): {file_path.name}", None
+                if img.format == 'TIFF' and getattr(img, 'n_frames', 1) > 1:
+                    return False, f"Skipped (multi-page): {file_path.name}", None
 
                 # Preserve EXIF data
                 exif_data = None
@@ -70,50 +219,221 @@ class ImageProcessor:
                     new_height = ImageProcessor.MAX_DIMENSION
                     new_width = int((width / height) * ImageProcessor.MAX_DIMENSION)
 
-                # Resize image
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                # Convert RGBA to RGB if necessary (WebP can handle RGBA, but just in case)
-                if img_resized.mode in ('RGBA', 'LA', 'P'):
-                    # Keep RGBA for transparency support
-                    pass
-                elif img_resized.mode != 'RGB':
-                    img_resized = img_resized.convert('RGB')
-
-                # Generate output path
-                output_path = file_path.with_suffix('.webp')
+                # Decode JPEG pixels with libjpeg-turbo when available (the primary image for MPO)
+                if TURBOJPEG_SUPPORT and img.format in ('JPEG', 'MPO'):
+                    pixels = ImageProcessor._decode_jpeg(data, width, height)
+                if pixels is not None:
+                    # Wrap the RGBX pixels without copying
+                    source = Image.frombuffer(
+                        'RGBX', (pixels.shape[1], pixels.shape[0]), pixels, 'raw', 'RGBX', 0, 1
+                    )
+                else:
+                    # Let libjpeg decode at a reduced DCT scale (no-op for other formats)
+                    img.draft('RGB', (new_width, new_height))
+                    source = img
 
-                # Save as WebP (lossy, quality 85)
-                save_kwargs = {
-                    'format': 'WEBP',
-                    'lossless': False,
-                    'quality': 85
-                }
+                # Resize image
+                img_resized = ImageProcessor._downscale(source, new_width, new_height, pixels)
+
+            finally:
+                # Free the full-size decoded pixels before encoding; only the resized
+                # copy is needed from here on, which roughly halves peak memory per worker
+                if source is not None and source is not img:
+                    source.close()
+                img.close()
+                del source, img, pixels
+
+            # Convert RGBA to RGB if necessary (WebP can handle RGBA, but just in case)
+            if img_resized.mode in ('RGBA', 'LA', 'P'):
+                # Keep RGBA for transparency support
+                pass
+            elif img_resized.mode != 'RGB':
+                img_resized = img_resized.convert('RGB')
+
+            # Encode as WebP (lossy, quality 85) into memory
+            webp_data = ImageProcessor._encode_webp(img_resized, exif_data)
+
+            return (
+                True,
+                f"Resized {max_dim}px → {max(new_width, new_height)}px: {file_path.name}",
+                webp_data
+            )
 
-                if exif_data:
-                    save_kwargs['exif'] = exif_data
+        except UnidentifiedImageError:
+            # Pillow's message would name the in-memory buffer rather than the file
+            return False, f"Error processing {file_path.name}: cannot identify image file", None
+        except Exception as e:
+            return False, f"Error processing {file_path.name}: {str(e)}", None
 
-                img_resized.save(output_path, **save_kwargs)
+    @staticmethod
+    def _downscale(img: Image.Image, new_width: int, new_height: int,
+                   pixels: Optional['np.ndarray'] = None) -> Image.Image:
+        """
+        Resize to (new_width, new_height).
+        With OpenCV, 8-bit images without alpha use cv2.resize with INTER_AREA;
+        `pixels` (the ndarray behind a TurboJPEG-decoded image) is passed to OpenCV
+        directly so the full-resolution image is not copied out of Pillow first.
+        Otherwise LANCZOS is used. For reductions of 4x or more, an integer box
+        reduce first brings the image down to at least 2x the target; LANCZOS cost
+        grows with the reduction factor, while reduce() is a cheap averaging pass.
+        """
+        # Alpha images stay on Pillow, which resizes them premultiplied (no dark fringes)
+        if OPENCV_SUPPORT and img.mode in ('L', 'RGB', 'RGBX'):
+            if pixels is None:
+                pixels = np.asarray(img)
+            resized = cv2.resize(pixels, (new_width, new_height), interpolation=cv2.INTER_AREA)
+            return Image.frombuffer(img.mode, (new_width, new_height), resized, 'raw', img.mode, 0, 1)
+
+        factor = max(img.size) // (ImageProcessor.MAX_DIMENSION * 2)
+        if factor > 1:
+            try:
+                img = img.reduce(factor)
+            except ValueError:
+                # reduce() doesn't support palette, bilevel or 16-bit modes
+                pass
+        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-                # Delete original file if conversion successful and filenames differ
-                if output_path != file_path and output_path.exists():
-                    file_path.unlink()
+    @staticmethod
+    def _encode_webp(img: Image.Image, exif_data: Optional[bytes]) -> bytes:
+        """Encode an image as lossy WebP (quality 85, method 4) into memory."""
+        save_kwargs = {
+            'format': 'WEBP',
+            'lossless': False,
+            'quality': 85,
+            'method': 4,  # libwebp speed/size trade-off (0=fastest, 6=smallest)
+            'exact': False  # allow changing RGB under fully transparent pixels
+        }
+
+        if exif_data:
+            save_kwargs['exif'] = exif_data
+
+        buffer = io.BytesIO()
+        img.save(buffer, **save_kwargs)
+        return buffer.getvalue()
 
-                return True, f"Resized {max_dim}px → {max(new_width, new_height)}px: {file_path.name}"
+    @staticmethod
+    def write_output(file_path: Path, webp_data: bytes) -> None:
+        """Write converted WebP data next to the original and delete the original (I/O stage)."""
+        # WebP inputs are rewritten in place. Deriving the name with with_suffix() would
+        # turn IMG.WEBP into IMG.webp, which on a case-insensitive filesystem is the
+        # same file, so deleting the "original" afterwards would delete the output.
+        in_place = file_path.suffix.lower() == '.webp'
+        output_path = file_path if in_place else file_path.with_suffix('.webp')
+
+        # Write to a uniquely named temporary file and rename it into place, so a failed
+        # write never leaves a truncated .webp behind (or clobbers an existing one), and
+        # same-stem sources (photo.jpg / photo.png) never share a temp file
+        fd, temp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f"{output_path.stem}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(webp_data)
+            # mkstemp creates the file owner-only; give the output the original's permissions
+            shutil.copymode(file_path, temp_name)
+            os.replace(temp_name, output_path)
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        # Delete original file once the output is in place
+        if not in_place:
+            file_path.unlink()
 
-        except Exception as e:
-            return False, f"Error processing {file_path.name}: {str(e)}"
+    @staticmethod
+    def _decode_jpeg(data: bytes, width: int, height: int) -> Optional['np.ndarray']:
+        """
+        Decode a JPEG with PyTurboJPEG (fast upsampling + fast DCT).
+        Uses libjpeg-turbo's scaled IDCT (1/2, 1/4, 1/8) to skip pixels that the
+        resize would throw away, while keeping the result >= MAX_DIMENSION.
+        Pixels are decoded as RGBX into the reusable scratch buffer (or a one-off
+        buffer if larger than the scratch limit) and returned as an (h, w, 4) view,
+        which is only valid until the next call in this process.
+        Returns None on failure so the caller can fall back to Pillow.
+        """
+        global _DECODE_SCRATCH
+        try:
+            # Largest power-of-two reduction that stays at or above the target size
+            max_dim = max(width, height)
+            denom = 1
+            for n in (8, 4, 2):
+                if max_dim // n >= ImageProcessor.MAX_DIMENSION and (1, n) in _TJ.scaling_factors:
+                    denom = n
+                    break
+
+            # Same rounding as libjpeg-turbo's TJSCALED()
+            scaled_width = (width + denom - 1) // denom
+            scaled_height = (height + denom - 1) // denom
+            size = scaled_width * scaled_height * 4
+
+            if size <= ImageProcessor.MAX_DIMENSION * ImageProcessor.MAX_DIMENSION * 4:
+                # Replace rather than resize: a live image may still export the old buffer
+                if _DECODE_SCRATCH is None or len(_DECODE_SCRATCH) < size:
+                    _DECODE_SCRATCH = bytearray(size)
+                buffer = _DECODE_SCRATCH
+            else:
+                buffer = bytearray(size)
+
+            dst = np.frombuffer(buffer, dtype=np.uint8, count=size).reshape(scaled_height, scaled_width, 4)
+            _TJ.decode(
+                data,
+                pixel_format=TJPF_RGBX,
+                scaling_factor=(1, denom) if denom > 1 else None,
+                flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT,
+                dst=dst
+            )
+            return dst
+        except Exception:
+            return None
 
     @staticmethod
-    def find_images(root_folder: Path) -> List[Path]:
-        """Recursively find all supported image files."""
+    def find_images(root_folder: Path) -> List[str]:
+        """
+        Recursively find all supported image files.
+        Uses os.scandir, whose entries cache their file type, so the walk needs no
+        extra stat call per file. Returns plain path strings.
+        """
         images = []
-        for file_path in root_folder.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
-                images.append(file_path)
+        stack = [os.fspath(root_folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stem, dot, ext = entry.name.rpartition('.')
+                            if stem and ext.lower() in ImageProcessor.SUPPORTED_EXTENSIONS:
+                                images.append(entry.path)
+            except OSError:
+                # Unreadable directory; skip it like rglob did
+                continue
         return images
 
 
+def _init_worker():
+    """Initialize a worker process (register optional image plugins once)."""
+    if HEIC_SUPPORT:
+        register_heif_opener()
+    if OPENCV_SUPPORT:
+        # Parallelism comes from the process pool; one OpenCV thread per worker
+        cv2.setNumThreads(1)
+
+    # Warm up the resampling code so the first real image doesn't pay for it
+    Image.new('RGB', (64, 64)).resize((32, 32), Image.Resampling.LANCZOS)
+
+
+def default_worker_count() -> int:
+    """One worker process per core (ProcessPoolExecutor allows at most 61 on Windows)."""
+    count = os.cpu_count() or 1
+    if sys.platform == 'win32':
+        count = min(61, count)
+    return count
+
+
+def create_worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create the process pool that decodes, resizes and encodes images."""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+
+
 class ProcessingThread(QThread):
     """Background thread for image processing."""
 
@@ -121,11 +441,22 @@ class ProcessingThread(QThread):
     log_message = pyqtSignal(str)
     finished = pyqtSignal(int, int, int)  # total_processed, total_resized, total_skipped
 
-    def __init__(self, folder_path: str, max_workers: int = None):
+    IO_WORKERS = 4  # Disk reads/writes; more threads only add seek contention
+
+    # Per-image log lines are sent to the GUI in batches to avoid flooding its event queue
+    LOG_BATCH_SIZE = 32
+    LOG_BATCH_INTERVAL_MS = 100
+
+    def __init__(self, folder_path: str, max_workers: int = None, cpu_pool: ProcessPoolExecutor = None):
         super().__init__()
         self.folder_path = Path(folder_path)
-        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        self.max_workers = max_workers or default_worker_count()
+        # Long-lived pool of max_workers processes to reuse; if None, one is created per run
+        self.cpu_pool = cpu_pool
         self.is_cancelled = False
+        self.pool_broken = False
+        self._log_batch = []
+        self._log_timer = QElapsedTimer()
 
     def run(self):
         """Execute the image processing workflow."""
@@ -141,53 +472,131 @@ class ProcessingThread(QThread):
                 return
 
             self.log_message.emit(f"Found {total_files} images. Starting processing...")
-            self.log_message.emit(f"Using {self.max_workers} worker threads.")
+            self.log_message.emit(
+                f"Using {self.max_workers} worker processes and {self.IO_WORKERS} I/O threads."
+            )
+            backend = "Pillow-SIMD" if PILLOW_SIMD else "Pillow"
+            self.log_message.emit(f"Image backend: {backend} {PIL.__version__}")
 
-            # Process images with thread pool
+            # Process images in a read (I/O) -> convert (CPU) -> write (I/O) pipeline
             total_resized = 0
             total_skipped = 0
             processed_count = 0
+            last_percent = -1
+            self._log_timer.start()
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                future_to_image = {
-                    executor.submit(ImageProcessor.process_image, img): img
-                    for img in images
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_image):
-                    if self.is_cancelled:
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        self.log_message.emit("Processing cancelled.")
-                        break
+            def handle_result(was_resized: bool, message: str):
+                nonlocal processed_count, total_resized, total_skipped, last_percent
+                processed_count += 1
+                self._queue_log(message)
 
-                    processed_count += 1
+                if was_resized:
+                    total_resized += 1
+                else:
+                    total_skipped += 1
 
-                    try:
-                        was_resized, message = future.result()
-                        self.log_message.emit(message)
+                # Update progress (only when the visible percentage changes)
+                percent = processed_count * 100 // total_files
+                if percent != last_percent:
+                    last_percent = percent
+                    self.progress_update.emit(processed_count, total_files)
 
-                        if was_resized:
-                            total_resized += 1
-                        else:
-                            total_skipped += 1
+            # Each image has exactly one pending future: (stage, file_path, convert result).
+            # Only `window` images are in flight, so memory and cancellation latency stay
+            # bounded no matter how large the folder is.
+            window = 2 * self.max_workers
+            pending = {}
+            next_index = 0
 
-                    except Exception as e:
-                        self.log_message.emit(f"Error: {str(e)}")
-                        total_skipped += 1
+            if self.cpu_pool is not None:
+                cpu_pool_context = nullcontext(self.cpu_pool)
+            else:
+                cpu_pool_context = create_worker_pool(self.max_workers)
+
+            with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as io_pool, cpu_pool_context as cpu_pool:
+                while True:
+                    # Refill the window (stop feeding new images once cancelled or the pool died)
+                    while (not self.is_cancelled and not self.pool_broken
+                           and next_index < total_files and len(pending) < window):
+                        file_path = Path(images[next_index])
+                        next_index += 1
+                        pending[io_pool.submit(ImageProcessor.read_image, file_path)] = ('read', file_path, None)
+
+                    if not pending:
+                        break
 
-                    # Update progress
-                    self.progress_update.emit(processed_count, total_files)
+                    done, _ = wait(
+                        pending,
+                        timeout=self.LOG_BATCH_INTERVAL_MS / 1000,
+                        return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        stage, file_path, converted = pending.pop(future)
+                        try:
+                            if stage == 'read':
+                                data, max_dim = future.result()
+                                if data is None:
+                                    # Header probe showed nothing to do; never reaches the CPU pool
+                                    handle_result(False, ImageProcessor.skipped_message(file_path, max_dim))
+                                    continue
+                                if self.is_cancelled:
+                                    continue
+                                convert_future = cpu_pool.submit(ImageProcessor.convert_image, file_path, data)
+                                pending[convert_future] = ('convert', file_path, None)
+
+                            elif stage == 'convert':
+                                was_resized, message, webp_data = future.result()
+                                if webp_data is None:
+                                    handle_result(was_resized, message)
+                                else:
+                                    write_future = io_pool.submit(ImageProcessor.write_output, file_path, webp_data)
+                                    pending[write_future] = ('write', file_path, (was_resized, message))
+
+                            else:
+                                future.result()
+                                handle_result(*converted)
+
+                        except BrokenProcessPool as e:
+                            # A worker died (e.g. out of memory); the pool takes no more work
+                            self.pool_broken = True
+                            handle_result(False, f"Error processing {file_path.name}: {str(e)}")
+
+                        except Exception as e:
+                            handle_result(False, f"Error processing {file_path.name}: {str(e)}")
+
+                    # Don't hold a partial batch back while images are slow to finish
+                    if self._log_timer.elapsed() >= self.LOG_BATCH_INTERVAL_MS:
+                        self._flush_log()
+
+            self._flush_log()
+            if self.pool_broken:
+                self.log_message.emit("Worker process pool failed; remaining images were not processed.")
+            if self.is_cancelled:
+                self.log_message.emit("Processing cancelled.")
 
             # Emit completion signal
             self.finished.emit(processed_count, total_resized, total_skipped)
 
         except Exception as e:
+            self._flush_log()
             self.log_message.emit(f"Fatal error: {str(e)}")
             self.log_message.emit(traceback.format_exc())
             self.finished.emit(0, 0, 0)
 
+    def _queue_log(self, message: str):
+        """Queue a log line, emitting the batch when it is full or old enough."""
+        self._log_batch.append(message)
+        if (len(self._log_batch) >= self.LOG_BATCH_SIZE
+                or self._log_timer.elapsed() >= self.LOG_BATCH_INTERVAL_MS):
+            self._flush_log()
+
+    def _flush_log(self):
+        """Emit all queued log lines as a single message."""
+        if self._log_batch:
+            self.log_message.emit("\n".join(self._log_batch))
+            self._log_batch = []
+        self._log_timer.restart()
+
     def cancel(self):
         """Cancel the processing."""
         self.is_cancelled = True
@@ -199,6 +608,15 @@ class ReSizerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.processing_thread = None
+
+        # One worker pool for the app's lifetime, so process start-up and imports are
+        # paid once rather than on every run
+        self.max_workers = default_worker_count()
+        self.worker_pool = create_worker_pool(self.max_workers)
+        # Workers start on demand; submit no-ops now so they are ready for the first run
+        for _ in range(self.max_workers):
+            self.worker_pool.submit(int)
+
         self.init_ui()
 
     def init_ui(self):
@@ -281,13 +699,14 @@ class ReSizerApp(QMainWindow):
         log_label = QLabel("Log:")
         layout.addWidget(log_label)
 
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(2000)  # Keep memory and layout cost bounded
         self.log_output.setStyleSheet("background-color: #f5f5f5; font-family: Consolas, monospace;")
         layout.addWidget(self.log_output)
 
         # Supported formats info
-        formats_text = f"Supported: JPG, JPEG, PNG, TIFF, BMP{', HEIC' if HEIC_SUPPORT else ''}"
+        formats_text = f"Supported: JPG, JPEG, PNG, TIFF, BMP, WEBP{', HEIC' if HEIC_SUPPORT else ''}"
         formats_label = QLabel(formats_text)
         formats_label.setStyleSheet("color: #888; font-size: 10px;")
         formats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -329,7 +748,7 @@ class ReSizerApp(QMainWindow):
         self.status_label.setStyleSheet("font-weight: bold; color: #007acc;")
 
         # Start processing thread
-        self.processing_thread = ProcessingThread(folder_path)
+        self.processing_thread = ProcessingThread(folder_path, self.max_workers, self.worker_pool)
         self.processing_thread.progress_update.connect(self.update_progress)
         self.processing_thread.log_message.connect(self.append_log)
         self.processing_thread.finished.connect(self.processing_finished)
@@ -343,14 +762,21 @@ class ReSizerApp(QMainWindow):
             self.status_label.setText(f"Status: Running ({current}/{total})")
 
     def append_log(self, message: str):
-        """Append message to log output."""
-        self.log_output.append(message)
-        # Auto-scroll to bottom
-        scrollbar = self.log_output.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """Append message (possibly several batched lines) to log output."""
+        # QPlainTextEdit keeps the view scrolled to the bottom while it is there
+        self.log_output.appendPlainText(message)
 
     def processing_finished(self, total_processed: int, total_resized: int, total_skipped: int):
         """Handle processing completion."""
+        # run() has emitted its last signal; let the thread exit so a later
+        # isRunning() from closeEvent never contends with its teardown
+        self.processing_thread.wait()
+
+        # Replace the worker pool if a worker process died during the run
+        if self.processing_thread.pool_broken:
+            self.worker_pool.shutdown(wait=False)
+            self.worker_pool = create_worker_pool(self.max_workers)
+
         # Re-enable controls
         self.start_button.setEnabled(True)
         self.browse_button.setEnabled(True)
@@ -392,15 +818,18 @@ class ReSizerApp(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 self.processing_thread.cancel()
                 self.processing_thread.wait()
+                self.worker_pool.shutdown(wait=True)
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.worker_pool.shutdown(wait=True)
             event.accept()
 
 
 def main():
     """Main entry point."""
+    multiprocessing.freeze_support()  # Required for worker processes in PyInstaller builds
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern cross-platform style
 